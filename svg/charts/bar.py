@@ -1,11 +1,18 @@
+import collections
+import functools
 import itertools
+import sys
 
 from lxml import etree
 
 from svg.charts.graph import Graph
 
+from .util import float_steps, format_number
+
 __all__ = 'Bar', 'VerticalBar', 'HorizontalBar'
 
+_XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+
 
 class Bar(Graph):
     """
@@ -67,6 +74,13 @@ class Bar(Graph):
     side - stack bars side-by-side
     """
 
+    reuse_bar_shapes = False
+    """
+    define each bar shape that occurs more than once in <defs> and
+    draw those bars with <use> references, shrinking the output
+    for charts with many identical bars
+    """
+
     scale_divisions = None
 
     stylesheet_names = Graph.stylesheet_names + ['bar.css']
@@ -78,11 +92,9 @@ class Bar(Graph):
     # adapted from Plot
     def get_data_values(self):
         min_value, max_value, scale_division = self.data_range()
-        result = tuple(
-            float_range(min_value, max_value + scale_division, scale_division)
-        )
+        result = float_steps(min_value, max_value + scale_division, scale_division)
         if self.scale_integers:
-            result = map(int, result)
+            result = tuple(map(int, result))
         return result
 
     # adapted from plot (very much like calling data_range('y'))
@@ -105,21 +117,23 @@ class Bar(Graph):
         return self.fields
 
     def get_data_labels(self):
-        return list(map(str, self.get_data_values()))
+        # round as Plot does, to avoid labels such as 0.30000000000000004
+        return [str(round(value, 4)) for value in self.get_data_values()]
+
+    def _data_extrema(self):
+        """
+        Return the (lowest, highest) values across all datasets.
+        """
+        rows = [dataset['data'] for dataset in self.data]
+        return min(map(min, rows)), max(map(max, rows))
 
     def data_max(self):
-        return max(
-            itertools.chain.from_iterable(map(lambda set: set['data'], self.data))
-        )
-        # above is same as
-        # return max(map(lambda set: max(set['data']), self.data))
+        return self._cached('_data_extrema')[1]
 
     def data_min(self):
         if self.min_scale_value is not None:
             return self.min_scale_value
-        min_value = min(
-            itertools.chain.from_iterable(map(lambda set: set['data'], self.data))
-        )
+        min_value = self._cached('_data_extrema')[0]
         min_value = min(min_value, 0)
         return min_value
 
@@ -139,14 +153,117 @@ class Bar(Graph):
         dataset_index is the index into the current dataset.
         field_index is the index into the current field set.
         """
-        return 'fill%s' % (dataset_index + 1)
+        return _fill_class_name(dataset_index + 1)
 
+    def draw_data(self):
+        bars = etree.SubElement(self.graph, 'g', {'class': 'bars'})
+        specs = list(self.get_bars())
+        shapes = self._define_shared_shapes(attrib for attrib, label in specs)
+        for attrib, label in specs:
+            if attrib is not None:
+                self._draw_bar(bars, attrib, shapes)
+            self.make_datapoint_text(*label)
+
+    def _define_shared_shapes(self, attribs):
+        """
+        If reuse_bar_shapes is set, add a rect to <defs> for each
+        (width, height) shared by more than one bar and return a
+        mapping of those sizes to the ids of their definitions.
+        """
+        if not self.reuse_bar_shapes:
+            return {}
+        sizes = collections.Counter(
+            (attrib['width'], attrib['height']) for attrib in attribs if attrib
+        )
+        defs = self.root.find('defs')
+        shapes = {}
+        for (width, height), count in sizes.items():
+            if count < 2:
+                continue
+            id = f'bar-shape-{len(shapes)}'
+            rect = {'id': id, 'width': width, 'height': height}
+            etree.SubElement(defs, 'rect', rect)
+            shapes[width, height] = id
+        return shapes
+
+    @staticmethod
+    def _draw_bar(parent, attrib, shapes):
+        shape = shapes.get((attrib['width'], attrib['height']))
+        if shape is None:
+            etree.SubElement(parent, 'rect', attrib)
+            return
+        etree.SubElement(
+            parent,
+            'use',
+            {
+                _XLINK_HREF: '#' + shape,
+                'x': attrib['x'],
+                'y': attrib['y'],
+                'class': attrib['class'],
+            },
+        )
+
+    def get_bars(self):
+        """
+        Generate an (attrib, label) pair for each bar, where attrib
+        holds the attributes of the bar's rect element (or None if
+        the bar has no length and so draws nothing) and label holds
+        the arguments to make_datapoint_text for its value.
+
+        Bar is an abstract base class; subclasses such as VerticalBar
+        and HorizontalBar must implement this method to lay out their
+        bars, which draw_data then draws.
+        """
+        raise NotImplementedError("Bar is an abstract base class")
 
-def float_range(start=0, stop=None, step=1):
-    "Much like the built-in function range, but accepts floats"
-    while start < stop:
-        yield float(start)
-        start += step
+
+@functools.cache
+def _fill_class_name(number):
+    "The (interned) CSS class for the numbered fill"
+    return sys.intern(f'fill{number}')
+
+
+def _vertical_geometry(values, min_value, unit_size, bottom):
+    """
+    Return a (value, length, top) triple for each vertical bar in values.
+    """
+    # cases (assume 0 = +ve):
+    #   value  min  length
+    #    +ve   +ve  value - min
+    #    +ve   -ve  value - 0
+    #    -ve   -ve  value.abs - 0
+    # top is 0 if value is negative
+    floor = max(min_value, 0)
+    return [
+        (
+            value,
+            (abs(value) - floor) * unit_size,
+            bottom - (max(value, 0) - min_value) * unit_size,
+        )
+        for value in values
+    ]
+
+
+def _horizontal_geometry(values, min_value, unit_size):
+    """
+    Return a (value, length, left) triple for each horizontal bar in values.
+    """
+    # cases (assume 0 = +ve):
+    #   value  min  length          left
+    #    +ve   +ve  value.abs - min minvalue.abs
+    #    +ve   -ve  value.abs - 0   minvalue.abs
+    #    -ve   -ve  value.abs - 0   minvalue.abs + value
+    # left is 0 if value is negative
+    floor = max(min_value, 0)
+    origin = abs(min_value)
+    return [
+        (
+            value,
+            (abs(value) - floor) * unit_size,
+            (origin + min(value, 0)) * unit_size,
+        )
+        for value in values
+    ]
 
 
 class VerticalBar(Bar):
@@ -161,14 +278,16 @@ class VerticalBar(Bar):
     def x_label_offset(self, width):
         return width / 2
 
-    def draw_data(self):
+    def get_bars(self):
         min_value = self.data_min()
+        data_values = self.get_data_values()
         unit_size = self.graph_height - self.font_size * 2 * self.top_font
-        unit_size /= max(self.get_data_values()) - min(self.get_data_values())
+        unit_size /= data_values[-1] - data_values[0]
 
-        bar_gap = self.get_bar_gap(self.get_field_width())
+        field_width = self.get_field_width()
+        bar_gap = self.get_bar_gap(field_width)
 
-        bar_width = self.get_field_width() - bar_gap
+        bar_width = field_width - bar_gap
         if self.stack == 'side':
             bar_width //= len(self.data)
 
@@ -176,38 +295,35 @@ class VerticalBar(Bar):
         if self.stack == 'side':
             x_mod -= bar_width // 2
 
+        # side-by-side bars are offset by dataset; other stacks share a position
+        dataset_offset = bar_width if self.stack == 'side' else 0
+
         bottom = self.graph_height
+        width = format_number(bar_width)
+
+        # compute the geometry of every bar up front, one series at a time
+        geometry = [
+            _vertical_geometry(dataset['data'], min_value, unit_size, bottom)
+            for dataset in self.data
+        ]
 
-        for field_count, _field in enumerate(self.fields):
-            for dataset_count, dataset in enumerate(self.data):
-                # cases (assume 0 = +ve):
-                #   value  min  length
-                #    +ve   +ve  value - min
-                #    +ve   -ve  value - 0
-                #    -ve   -ve  value.abs - 0
-                value = dataset['data'][field_count]
-
-                left = self.get_field_width() * field_count
-
-                length = (abs(value) - max(min_value, 0)) * unit_size
-                # top is 0 if value is negative
-                top = bottom - ((max(value, 0) - min_value) * unit_size)
-                if self.stack == 'side':
-                    left += bar_width * dataset_count
-
-                etree.SubElement(
-                    self.graph,
-                    'rect',
-                    {
-                        'x': str(left),
-                        'y': str(top),
-                        'width': str(bar_width),
-                        'height': str(length),
-                        'class': self._fill_class(dataset_count, field_count),
-                    },
-                )
-
-                self.make_datapoint_text(left + bar_width / 2, top - 6, value)
+        field_lefts = [field_width * count for count in range(len(self.fields))]
+        bars = itertools.product(enumerate(field_lefts), enumerate(geometry))
+        for (field_count, field_left), (dataset_count, series) in bars:
+            value, length, top = series[field_count]
+
+            left = field_left + dataset_offset * dataset_count
+
+            attrib = None
+            if length > 0:
+                attrib = {
+                    'x': format_number(left),
+                    'y': format_number(top),
+                    'width': width,
+                    'height': format_number(length),
+                    'class': self._fill_class(dataset_count, field_count),
+                }
+            yield attrib, (left + bar_width / 2, top - 6, value)
 
 
 class HorizontalBar(Bar):
@@ -225,49 +341,52 @@ class HorizontalBar(Bar):
     def y_label_offset(self, height):
         return height / -2
 
-    def draw_data(self):
+    def get_bars(self):
         min_value = self.data_min()
+        data_values = self.get_data_values()
 
         unit_size = self.graph_width
         unit_size -= self.font_size * 2 * self.right_font
-        unit_size /= max(self.get_data_values()) - min(self.get_data_values())
+        unit_size /= data_values[-1] - data_values[0]
 
-        bar_gap = self.get_bar_gap(self.get_field_height())
+        field_height = self.get_field_height()
+        bar_gap = self.get_bar_gap(field_height)
 
-        bar_height = self.get_field_height() - bar_gap
+        bar_height = field_height - bar_gap
         if self.stack == 'side':
             bar_height //= len(self.data)
 
+        # side-by-side bars are offset by dataset; other stacks share a position
+        dataset_offset = bar_height if self.stack == 'side' else 0
+
         y_mod = (bar_height // 2) + (self.font_size // 2)
 
-        for field_count, _field in enumerate(self.fields):
-            for dataset_count, dataset in enumerate(self.data):
-                value = dataset['data'][field_count]
-
-                top = self.graph_height - (self.get_field_height() * (field_count + 1))
-                if self.stack == 'side':
-                    top += bar_height * dataset_count
-                # cases (assume 0 = +ve):
-                #   value  min  length          left
-                #    +ve   +ve  value.abs - min minvalue.abs
-                #    +ve   -ve  value.abs - 0   minvalue.abs
-                #    -ve   -ve  value.abs - 0   minvalue.abs + value
-                length = (abs(value) - max(min_value, 0)) * unit_size
-                # left is 0 if value is negative
-                left = (abs(min_value) + min(value, 0)) * unit_size
-
-                etree.SubElement(
-                    self.graph,
-                    'rect',
-                    {
-                        'x': str(left),
-                        'y': str(top),
-                        'width': str(length),
-                        'height': str(bar_height),
-                        'class': self._fill_class(dataset_count, field_count),
-                    },
-                )
-
-                self.make_datapoint_text(
-                    left + length + 5, top + y_mod, value, "text-anchor: start; "
-                )
+        height = format_number(bar_height)
+
+        # compute the geometry of every bar up front, one series at a time
+        geometry = [
+            _horizontal_geometry(dataset['data'], min_value, unit_size)
+            for dataset in self.data
+        ]
+
+        field_tops = [
+            self.graph_height - (field_height * (count + 1))
+            for count in range(len(self.fields))
+        ]
+        bars = itertools.product(enumerate(field_tops), enumerate(geometry))
+        for (field_count, field_top), (dataset_count, series) in bars:
+            value, length, left = series[field_count]
+
+            top = field_top + dataset_offset * dataset_count
+
+            attrib = None
+            if length > 0:
+                attrib = {
+                    'x': format_number(left),
+                    'y': format_number(top),
+                    'width': format_number(length),
+                    'height': height,
+                    'class': self._fill_class(dataset_count, field_count),
+                }
+            label = left + length + 5, top + y_mod, value, "text-anchor: start; "
+            yield attrib, label
@@ -7,6 +7,8 @@ The base module for `svg.charts` classes.
 import collections.abc
 import functools
 import itertools
+import re
+import weakref
 from operator import itemgetter
 
 try:
@@ -17,9 +19,16 @@ except ImportError:
 import cssutils
 from lxml import etree
 
+from .util import format_number
+
 # cause the SVG profile to be loaded
 __import__('svg.charts.css')
 
+cssutils.log.setLevel(30)  # disable INFO log messages
+
+_minified_prefs = cssutils.serialize.Preferences()
+_minified_prefs.useMinified()
+
 
 class Graph:
     """
@@ -46,6 +55,8 @@ class Graph:
     show_x_guidelines = False
     show_y_guidelines = True
     show_data_values = True
+    # outline data values in white to set them off from the chart beneath
+    show_data_value_halo = True
     min_scale_value = None
     show_x_labels = True
     stagger_x_labels = False
@@ -142,23 +153,63 @@ class Graph:
         Raises ValueError when no data set has
         been added to the graph object.
         """
+        return self.render(self._burn_tree())
+
+    def burn_to(self, file):
+        """
+        Process the template as burn does, but write the resulting
+        SVG document as UTF-8 to file (a filename or a binary file
+        object), avoiding the intermediate string.
+        """
+        tree = self._burn_tree().getroottree()
+        tree.write(file, encoding='utf-8', xml_declaration=True)
+
+    def _burn_tree(self):
         if not self.data:
             raise ValueError("No data available")
 
         if hasattr(self, 'calculations'):
             self.calculations()
 
-        self.start_svg()
-        self.calculate_graph_dimensions()
-        self.foreground = etree.Element("g")
-        self.draw_graph()
-        self.draw_titles()
-        self.draw_legend()
-        self.draw_data()
-        self.graph.append(self.foreground)
-        self.render_inline_styles()
+        self._render_cache = {}
+        try:
+            self.start_svg()
+            self.calculate_graph_dimensions()
+            self.foreground = etree.Element("g")
+            self.draw_graph()
+            self.draw_titles()
+            self.draw_legend()
+            self.draw_data()
+            self.graph.append(self.foreground)
+            self.render_inline_styles()
+        finally:
+            del self._render_cache
+
+        return self.root
+
+    def _cached(self, name, *args):
+        """
+        Return the result of the named method (such as get_x_labels)
+        called with args, computed at most once per burn. Iterators
+        are collected into a tuple so the result may be reused.
+        """
+        cache = self.__dict__.get('_render_cache')
+        key = (name, *args)
+        if cache is not None and key in cache:
+            return cache[key]
+        result = getattr(self, name)(*args)
+        if isinstance(result, collections.abc.Iterator):
+            result = tuple(result)
+        if cache is not None:
+            cache[key] = result
+        return result
 
-        return self.render(self.root)
+    def _longest(self, name):
+        """
+        Return the length of the longest of the named labels (such as
+        get_x_labels), or 0 if there are none.
+        """
+        return max(map(len, self._cached(name)), default=0)
 
     @staticmethod
     def render(tree):
@@ -176,8 +227,7 @@ class Graph:
         if self.rotate_y_labels:
             max_y_label_height_px = self.y_label_font_size
         else:
-            label_lengths = map(len, self.get_y_labels())
-            max_y_label_len = max(label_lengths)
+            max_y_label_len = self._cached('_longest', 'get_y_labels')
             max_y_label_height_px = 0.6 * max_y_label_len * self.y_label_font_size
         if self.show_y_labels:
             bl += max_y_label_height_px
@@ -202,7 +252,7 @@ class Graph:
         """
         br = 7
         if self.key and self.key_position == 'right':
-            max_key_len = max(map(len, self.keys()))
+            max_key_len = self._cached('_longest', 'keys')
             br += max_key_len * self.key_font_size * 0.6
             br += self.KEY_BOX_SIZE
             br += 10  # Some padding around the box
@@ -224,10 +274,12 @@ class Graph:
     def _w3c_name(name):
         """
         Generate a W3C Name from a string.
+
+        >>> Graph._w3c_name('a b:c')
+        'a_b-c'
         """
         # for now, fake it by replacing known bad characters with good ones.
-        name = name.replace(':', '-')
-        name = name.replace(' ', '_')
+        return name.translate(_W3C_NAME_REPLACEMENTS)
 
     def add_popup(self, x, y, label):
         """
@@ -272,8 +324,7 @@ class Graph:
         if self.show_x_labels:
             max_x_label_height_px = self.x_label_font_size
             if self.rotate_x_labels:
-                label_lengths = map(len, self.get_x_labels())
-                max_x_label_len = functools.reduce(max, label_lengths)
+                max_x_label_len = self._cached('_longest', 'get_x_labels')
                 max_x_label_height_px *= 0.6 * max_x_label_len
             bb += max_x_label_height_px
             if self.stagger_x_labels:
@@ -336,45 +387,45 @@ class Graph:
         if not self.show_data_values:
             # do nothing
             return
-        # first lay down the text in a wide white stroke to
-        #  differentiate it from the background
-        e = etree.SubElement(
-            self.foreground,
-            'text',
-            {
-                'x': str(x),
-                'y': str(y),
-                'class': 'dataPointLabel',
-                'style': '{style} stroke: #fff; stroke-width: 2;'.format(**vars()),
-            },
-        )
-        e.text = str(value)
+        x, y, text = format_number(x), format_number(y), str(value)
+        if self.show_data_value_halo:
+            # first lay down the text in a wide white stroke to
+            #  differentiate it from the background
+            halo_style = 'stroke: #fff; stroke-width: 2;'
+            if style:
+                halo_style = f'{style} {halo_style}'
+            e = etree.SubElement(
+                self.foreground,
+                'text',
+                {'x': x, 'y': y, 'class': 'dataPointLabel', 'style': halo_style},
+            )
+            e.text = text
         # then lay down the text in the specified style
         e = etree.SubElement(
-            self.foreground,
-            'text',
-            {'x': str(x), 'y': str(y), 'class': 'dataPointLabel'},
+            self.foreground, 'text', {'x': x, 'y': y, 'class': 'dataPointLabel'}
         )
-        e.text = str(value)
+        e.text = text
         if style:
             e.set('style', style)
 
     def draw_x_labels(self):
         "Draw the X axis labels"
         if self.show_x_labels:
-            labels = self.get_x_labels()
+            labels = self._cached('get_x_labels')
             count = len(labels)
 
             labels = enumerate(iter(labels))
             start = int(not self.step_include_first_x_label)
             labels = itertools.islice(labels, start, None, self.step_x_labels)
-            list(map(self.draw_x_label, labels))
-            self.draw_x_guidelines(self.field_width(), count)
+            for label in labels:
+                self.draw_x_label(label)
+            self.draw_x_guidelines(self._cached('field_width'), count)
 
     def draw_x_label(self, label):
-        label_width = self.field_width()
+        # the field width is the same for every label; compute it once
+        label_width = self._cached('field_width')
         index, label = label
-        text = etree.SubElement(self.graph, 'text', {'class': 'xAxisLabels'})
+        text = etree.SubElement(self.graph, 'text', _X_LABEL_ATTRIB)
         text.text = label
 
         x = index * label_width + self.x_label_offset(label_width)
@@ -410,14 +461,14 @@ class Graph:
 
     def get_field_width(self):
         return float(self.graph_width - self.font_size * 2 * self.right_font) / (
-            len(self.get_x_labels()) - self.right_align
+            len(self._cached('get_x_labels')) - self.right_align
         )
 
     field_width = get_field_width
 
     def get_field_height(self):
         return float(self.graph_height - self.font_size * 2 * self.top_font) / (
-            len(self.get_y_labels()) - self.top_align
+            len(self._cached('get_y_labels')) - self.top_align
         )
 
     field_height = get_field_height
@@ -428,17 +479,18 @@ class Graph:
             # do nothing
             return
 
-        labels = self.get_y_labels()
+        labels = self._cached('get_y_labels')
         count = len(labels)
 
         labels = enumerate(iter(labels))
         start = int(not self.step_include_first_y_label)
         labels = itertools.islice(labels, start, None, self.step_y_labels)
-        list(map(self.draw_y_label, labels))
-        self.draw_y_guidelines(self.field_height(), count)
+        for label in labels:
+            self.draw_y_label(label)
+        self.draw_y_guidelines(self._cached('field_height'), count)
 
     def get_y_offset(self):
-        result = self.graph_height + self.y_label_offset(self.field_height())
+        result = self.graph_height + self.y_label_offset(self._cached('field_height'))
         if not self.rotate_y_labels:
             result += self.font_size / 1.2
         return result
@@ -446,9 +498,10 @@ class Graph:
     y_offset = property(get_y_offset)
 
     def draw_y_label(self, label):
-        label_height = self.field_height()
+        # the field height is the same for every label; compute it once
+        label_height = self._cached('field_height')
         index, label = label
-        text = etree.SubElement(self.graph, 'text', {'class': 'yAxisLabels'})
+        text = etree.SubElement(self.graph, 'text', _Y_LABEL_ATTRIB)
         text.text = label
 
         y = self.y_offset - (label_height * index)
@@ -481,20 +534,34 @@ class Graph:
         "Draw the X-axis guidelines"
         if not self.show_x_guidelines:
             return
+        suffix = f' 0 v{self.graph_height}'
         # skip the first one
-        for count in range(1, count):
-            move = f'M {label_height * count} 0 v{self.graph_height}'
-            path = {'d': move, 'class': 'guideLines'}
-            etree.SubElement(self.graph, 'path', path)
+        paths = (
+            etree.Element(
+                'path',
+                {'d': f'M {label_height * count}{suffix}', 'class': 'guideLines'},
+            )
+            for count in range(1, count)
+        )
+        self.graph.extend(paths)
 
     def draw_y_guidelines(self, label_height, count):
         "Draw the Y-axis guidelines"
         if not self.show_y_guidelines:
             return
-        for count in range(1, count):
-            move = f'M 0 {self.graph_height - label_height * count} h{self.graph_width}'
-            path = {'d': move, 'class': 'guideLines'}
-            etree.SubElement(self.graph, 'path', path)
+        graph_height = self.graph_height
+        suffix = f' h{self.graph_width}'
+        paths = (
+            etree.Element(
+                'path',
+                {
+                    'd': f'M 0 {graph_height - label_height * count}{suffix}',
+                    'class': 'guideLines',
+                },
+            )
+            for count in range(1, count)
+        )
+        self.graph.extend(paths)
 
     def draw_titles(self):
         "Draws the graph title and subtitle"
@@ -569,29 +636,29 @@ class Graph:
 
         group = etree.SubElement(self.root, 'g')
 
-        for key_count, key_name in enumerate(self.keys()):
-            y_offset = (self.KEY_BOX_SIZE * key_count) + (key_count * 5)
-            etree.SubElement(
-                group,
+        box_size = self.KEY_BOX_SIZE
+        size = str(box_size)
+        text_x = str(box_size + 5)
+        entries = []
+        for key_count, key_name in enumerate(self._cached('keys')):
+            y_offset = (box_size * key_count) + (key_count * 5)
+            box = etree.Element(
                 'rect',
                 {
                     'x': '0',
                     'y': str(y_offset),
-                    'width': str(self.KEY_BOX_SIZE),
-                    'height': str(self.KEY_BOX_SIZE),
-                    'class': 'key%s' % (key_count + 1),
+                    'width': size,
+                    'height': size,
+                    'class': f'key{key_count + 1}',
                 },
             )
-            text = etree.SubElement(
-                group,
+            text = etree.Element(
                 'text',
-                {
-                    'x': str(self.KEY_BOX_SIZE + 5),
-                    'y': str(y_offset + self.KEY_BOX_SIZE),
-                    'class': 'keyText',
-                },
+                {'x': text_x, 'y': str(y_offset + box_size), 'class': 'keyText'},
             )
             text.text = key_name
+            entries += box, text
+        group.extend(entries)
 
         if self.key_position == 'right':
             x_offset = self.graph_width + self.border_left + 10
@@ -606,7 +673,7 @@ class Graph:
         if self.show_x_labels:
             max_x_label_height_px = self.x_label_font_size
             if self.rotate_x_labels:
-                longest_label_length = max(map(len, self.get_x_labels()))
+                longest_label_length = self._cached('_longest', 'get_x_labels')
                 # note: I think 0.6 is the ratio of width to height of characters
                 max_x_label_height_px *= longest_label_length * 0.6
             y_offset += max_x_label_height_px
@@ -622,30 +689,51 @@ class Graph:
             # do nothing
             return
 
-        styles = self.parse_css()
-        for node in self.root.xpath('//*[@class]'):
-            cl = '.' + node.attrib['class']
-            if cl not in styles:
+        if type(self).parse_css is Graph.parse_css:
+            styles = self._get_shared_styles()
+        else:
+            styles = self.parse_css()
+        for node in self.root.iter(etree.Element):
+            cl = node.get('class')
+            if cl is None:
                 continue
-            style = styles[cl]
-            if 'style' in node.attrib:
-                style += node.attrib['style']
-            node.attrib['style'] = style
+            style = styles.get('.' + cl)
+            if style is None:
+                continue
+            own_style = node.get('style')
+            if own_style is not None:
+                style += own_style
+            node.set('style', style)
 
     def parse_css(self):
         """
         Take a .css file (classes only please) and parse it into a dictionary
         of class/style pairs.
         """
-        # todo: save the prefs for use later
-        # orig_prefs = cssutils.ser.prefs
-        cssutils.ser.prefs.useMinified()
-        pairs = (
-            (r.selectorText, r.style.cssText)
-            for r in self.get_stylesheet()
-            if not isinstance(r, cssutils.css.CSSComment)
-        )
-        return dict(pairs)
+        return dict(self._get_shared_styles())
+
+    def _get_shared_styles(self):
+        """
+        Get the class/style pairs of the shared stylesheet, found once
+        per sheet. The mapping is shared, so it must not be modified.
+        """
+        sheet = self._get_shared_stylesheet()
+        try:
+            return _parsed_css[sheet]
+        except KeyError:
+            pass
+        # serialize the styles minified, leaving the global prefs as found
+        orig_prefs, cssutils.ser.prefs = cssutils.ser.prefs, _minified_prefs
+        try:
+            pairs = (
+                (r.selectorText, r.style.cssText)
+                for r in sheet
+                if not isinstance(r, cssutils.css.CSSComment)
+            )
+            result = _parsed_css[sheet] = dict(pairs)
+        finally:
+            cssutils.ser.prefs = orig_prefs
+        return result
 
     def add_defs(self, defs):
         """
@@ -653,39 +741,25 @@ class Graph:
         """
 
     def _get_root_attributes(self):
-        ADOBE_EXT_NS = '{http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/}'
         return {
             'width': str(self.width),
             'height': str(self.height),
             'viewBox': f'0 0 {self.width} {self.height}',
-            ADOBE_EXT_NS + 'scriptImplementation': 'Adobe',
+            _ADOBE_SCRIPT_IMPLEMENTATION: 'Adobe',
         }
 
     def start_svg(self):
         "Base SVG Document Creation"
-        SVG_NAMESPACE = 'http://www.w3.org/2000/svg'
-        SVG = '{%s}' % SVG_NAMESPACE
-        NSMAP = {
-            None: SVG_NAMESPACE,
-            'xlink': 'http://www.w3.org/1999/xlink',
-            'a3': 'http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/',
-        }
         root_attrs = self._get_root_attributes()
-        self.root = etree.Element(SVG + "svg", attrib=root_attrs, nsmap=NSMAP)
+        self.root = etree.Element(_SVG_TAG, attrib=root_attrs, nsmap=_NSMAP)
         if hasattr(self, 'style_sheet_href'):
             pi = etree.ProcessingInstruction(
                 'xml-stylesheet', 'href="%s" type="text/css"' % self.style_sheet_href
             )
             self.root.addprevious(pi)
 
-        comment_strings = (
-            ' Created with SVG.Graph ',
-            ' SVG.Graph by Jason R. Coombs ',
-            ' Based on SVG::Graph by Sean E. Russel ',
-            ' Based on Perl SVG:TT:Graph by Leo Lapworth & Stephan Morgan ',
-            ' ' + '/' * 66,
-        )
-        list(map(self.root.append, map(etree.Comment, comment_strings)))
+        for comment in _COMMENT_STRINGS:
+            self.root.append(etree.Comment(comment))
 
         defs = etree.SubElement(self.root, 'defs')
         self.add_defs(defs)
@@ -697,7 +771,7 @@ class Graph:
             style = etree.SubElement(defs, 'style', type='text/css')
             # TODO: the text was previously escaped in a CDATA declaration... how
             #  to do that with etree?
-            style.text = self.get_stylesheet().cssText
+            style.text = _serialize_stylesheet(self._get_shared_stylesheet())
 
         self.root.append(etree.Comment('SVG Background'))
         etree.SubElement(
@@ -724,20 +798,27 @@ class Graph:
     def load_resource_stylesheet(name, subs=None):
         if subs is None:
             subs = dict()
-        template = importlib_resources.read_text('svg.charts', name)
-        source = template % subs
+        source = _read_stylesheet_template(name) % subs
         return cssutils.parseString(source)
 
+    def _get_stylesheet_sources(self):
+        "Get the stylesheet source text for this instance"
+        return tuple(map(self._fill_stylesheet_template, self.stylesheet_names))
+
+    def _fill_stylesheet_template(self, name):
+        # allow css to include class variables
+        subs = {field: getattr(self, field) for field in _template_fields(name)}
+        return _read_stylesheet_template(name) % subs
+
     def get_stylesheet_resources(self):
         "Get the stylesheets for this instance"
         # allow css to include class variables
         class_vars = class_dict(self)
         loader = functools.partial(self.load_resource_stylesheet, subs=class_vars)
-        sheets = list(map(loader, self.stylesheet_names))
-        return sheets
+        return list(map(loader, self.stylesheet_names))
 
     def get_stylesheet(self):
-        cssutils.log.setLevel(30)  # disable INFO log messages
+        "Get the merged stylesheet for this instance"
 
         def merge_sheets(s1, s2):
             list(map(s1.add, s2))
@@ -745,6 +826,88 @@ class Graph:
 
         return functools.reduce(merge_sheets, self.get_stylesheet_resources())
 
+    def _get_shared_stylesheet(self):
+        """
+        Get the stylesheet used to render this instance, without
+        modifying it. Unless the stylesheet hooks are overridden, the
+        sheet is parsed once and shared by every graph with the same
+        stylesheet sources.
+        """
+        cls = type(self)
+        if (
+            cls.get_stylesheet is Graph.get_stylesheet
+            and cls.get_stylesheet_resources is Graph.get_stylesheet_resources
+            and cls.load_resource_stylesheet is Graph.load_resource_stylesheet
+        ):
+            return _merge_stylesheets(self._get_stylesheet_sources())
+        return self.get_stylesheet()
+
+
+_SVG_NAMESPACE = 'http://www.w3.org/2000/svg'
+_ADOBE_EXT_NAMESPACE = 'http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/'
+_SVG_TAG = f'{{{_SVG_NAMESPACE}}}svg'
+_ADOBE_SCRIPT_IMPLEMENTATION = f'{{{_ADOBE_EXT_NAMESPACE}}}scriptImplementation'
+_NSMAP = {
+    None: _SVG_NAMESPACE,
+    'xlink': 'http://www.w3.org/1999/xlink',
+    'a3': _ADOBE_EXT_NAMESPACE,
+}
+
+_COMMENT_STRINGS = (
+    ' Created with SVG.Graph ',
+    ' SVG.Graph by Jason R. Coombs ',
+    ' Based on SVG::Graph by Sean E. Russel ',
+    ' Based on Perl SVG:TT:Graph by Leo Lapworth & Stephan Morgan ',
+    ' ' + '/' * 66,
+)
+"The comments identifying the origins of each document"
+
+# attributes shared by every element of a kind (lxml copies them)
+_X_LABEL_ATTRIB = {'class': 'xAxisLabels'}
+_Y_LABEL_ATTRIB = {'class': 'yAxisLabels'}
+
+_W3C_NAME_REPLACEMENTS = str.maketrans({':': '-', ' ': '_'})
+"Characters not valid in a W3C Name and their replacements"
+
+_parsed_css: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"The class/style pairs of each stylesheet, as found by Graph._get_shared_styles"
+
+
+_serialized_css: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"The text of each stylesheet, as embedded by Graph.start_svg"
+
+
+def _serialize_stylesheet(sheet):
+    """
+    Return the cssText of sheet, serializing each sheet only once.
+    """
+    try:
+        return _serialized_css[sheet]
+    except KeyError:
+        pass
+    result = _serialized_css[sheet] = sheet.cssText
+    return result
+
+
+@functools.cache
+def _read_stylesheet_template(name):
+    return importlib_resources.read_text('svg.charts', name)
+
+
+@functools.cache
+def _template_fields(name):
+    "The names of the attributes substituted into the named stylesheet"
+    template = _read_stylesheet_template(name)
+    return tuple(dict.fromkeys(re.findall(r'%\((\w+)\)', template)))
+
+
+@functools.lru_cache(maxsize=32)
+def _merge_stylesheets(sources):
+    """
+    Parse the stylesheet sources, in order, as one sheet.
+    """
+    return cssutils.parseString('\n'.join(sources))
+
 
 class DrawHooks:
     """
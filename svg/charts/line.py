@@ -1,12 +1,10 @@
-import functools
 import itertools
 from operator import add, itemgetter
 
 from lxml import etree
-from more_itertools.recipes import flatten
 
 from .graph import Graph
-from .util import float_range
+from .util import float_steps
 
 
 class Line(Graph):
@@ -29,32 +27,29 @@ class Line(Graph):
 
     stylesheet_names = Graph.stylesheet_names + ['plot.css']
 
-    def max_value(self):
-        data = map(itemgetter('data'), self.data)
+    def _data_extrema(self):
+        """
+        Return the (lowest, highest) values as charted.
+        """
+        rows = [dataset['data'] for dataset in self.data]
         if self.stacked:
-            data = self.get_cumulative_data()
-        return max(flatten(data))
+            rows = self._cached('get_cumulative_data')
+        return min(map(min, rows)), max(map(max, rows))
+
+    def max_value(self):
+        return self._cached('_data_extrema')[1]
 
     def min_value(self):
-        if self.min_scale_value:
+        if self.min_scale_value is not None:
             return self.min_scale_value
-        data = map(itemgetter('data'), self.data)
-        if self.stacked:
-            data = self.get_cumulative_data()
-        return min(flatten(data))
+        return self._cached('_data_extrema')[0]
 
     def get_cumulative_data(self):
         """Get the data as it will be charted.  The first set will be
         the actual first data set.  The second will be the sum of the
         first and the second, etc."""
         sets = map(itemgetter('data'), self.data)
-        if not sets:
-            return
-        sum = sets.pop(0)
-        yield sum
-        while sets:
-            sum = map(add, sets.pop(0))
-            yield sum
+        return itertools.accumulate(sets, _add_series)
 
     def get_x_labels(self):
         return self.fields
@@ -76,12 +71,12 @@ class Line(Graph):
         if self.scale_integers:
             scale_division = max(1, round(scale_division))
 
-        # float_range excludes the stop value, so to ensure we always
+        # float_steps excludes the stop value, so to ensure we always
         #  have the last label rendered, add a scale_division. Think like
         #  xrange(1,11) for 1-10.
         max_value += scale_division
 
-        labels = tuple(float_range(min_value, max_value, scale_division))
+        labels = float_steps(min_value, max_value, scale_division)
         return labels
 
     def get_y_labels(self):
@@ -106,35 +101,40 @@ class Line(Graph):
         field_width = self.field_width()
         # line = len(self.data)
 
-        prev_sum = [0] * len(self.fields)
-        cum_sum = [-min_value] * len(self.fields)
-
-        coord_format = '{0[x]} {0[y]}'.format
-
-        for line_n, data in reversed(list(enumerate(self.data, 1))):
-            if not self.stacked:
-                cum_sum = [-min_value] * len(self.fields)
-
-            cum_sum = map(add, cum_sum, data['data'])
-            get_coords = functools.partial(
-                self.calc_coords, width=field_width, height=field_height
+        rows = [dataset['data'] for dataset in self.data]
+        if self.stacked:
+            rows = self._cached('get_cumulative_data')
+        sums = [[value - min_value for value in row] for row in rows]
+        # a stacked area is filled down to the series beneath it
+        prev_sums = [[0] * len(self.fields)] + sums[:-1]
+
+        def get_points(values):
+            "The (x, y) coordinates of the values across the fields"
+            calc = self.calc_coords
+            coords = (
+                calc(field, value, field_width, field_height)
+                for field, value in enumerate(values)
             )
-            coords = itertools.starmap(get_coords, enumerate(cum_sum))
-            paths = map(coord_format, coords)
-            line_path = ' '.join(paths)
+            return [(coord['x'], coord['y']) for coord in coords]
+
+        series = zip(range(1, len(sums) + 1), sums, prev_sums)
+        for line_n, cum_sum, prev_sum in reversed(list(series)):
+            # the coordinates of each point, shared by the line and the points
+            points = get_points(cum_sum)
+            texts = [(str(x), str(y)) for x, y in points]
+            line_path = ' '.join(map(' '.join, texts))
 
             if self.area_fill:
                 # to draw the area, we'll use the line above, followed by
                 #  tracing the bottom from right to left
                 if self.stacked:
-                    prev_sum_rev = list(enumerate(prev_sum)).reversed()
-                    coords = map(get_coords, prev_sum_rev)
-                    paths = map(coord_format, coords)
-                    area_path = ' '.join(paths)
-                    origin = paths[-1]
+                    # the bottom is the top of the previous series
+                    bottom = [f'{x} {y}' for x, y in get_points(prev_sum)]
+                    area_path = ' '.join(reversed(bottom))
+                    origin = bottom[0]
                 else:
                     area_path = "V{graph_height}".format(**vars(self))
-                    origin = coord_format(get_coords(0, 0))
+                    origin = '{} {}'.format(*get_points([0])[0])
 
                 d = ' '.join(('M', origin, 'L', line_path, area_path, 'Z'))
                 etree.SubElement(
@@ -153,21 +153,23 @@ class Line(Graph):
                 },
             )
 
-            if self.show_data_points or self.show_data_values:
-                for i, value in enumerate(cum_sum):
-                    if self.show_data_points:
-                        etree.SubElement(
-                            self.graph,
-                            'circle',
-                            {'class': 'dataPoint{line_n}'.format(**vars())},
-                            cx=str(field_width * i),
-                            cy=str(self.graph_height - value * field_height),
-                            r='2.5',
-                        )
-                    self.make_datapoint_text(
-                        field_width * i,
-                        self.graph_height - value * field_height - 6,
-                        value + min_value,
+            if self.show_data_points:
+                point_class = f'dataPoint{line_n}'
+                circles = (
+                    etree.Element(
+                        'circle',
+                        {'cx': x, 'cy': y, 'r': '2.5', 'class': point_class},
                     )
+                    for x, y in texts
+                )
+                self.graph.extend(circles)
+
+            if self.show_data_values:
+                make_text = self.make_datapoint_text
+                for (x, y), value in zip(points, cum_sum):
+                    make_text(x, y - 6, value + min_value)
+
 
-            prev_sum = list(cum_sum)
+def _add_series(total, data):
+    "Add the values of data to the running total for each field"
+    return tuple(map(add, total, data))
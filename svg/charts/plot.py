@@ -3,13 +3,14 @@
 import functools
 import itertools
 import math
+from operator import itemgetter
 
 import more_itertools
 from lxml import etree
 
 from svg.charts.graph import Graph
 
-from .util import float_range
+from .util import float_steps
 
 get_pairs = functools.partial(more_itertools.chunked, n=2)
 
@@ -178,17 +179,18 @@ class Plot(Graph):
             [len(x) for x in series]
         except TypeError:
             series = list(get_pairs(series))
-        data['data'] = sorted(series)
+        # order by x alone; points sharing an x keep their given order
+        data['data'] = sorted(series, key=itemgetter(self.x_data_index))
 
     def calculate_left_margin(self):
         super().calculate_left_margin()
-        left_label_text = str(self.get_x_labels()[0])
+        left_label_text = str(self._cached('get_x_labels')[0])
         label_left = len(left_label_text) / 2 * self.font_size * 0.6
         self.border_left = max(label_left, self.border_left)
 
     def calculate_right_margin(self):
         super().calculate_right_margin()
-        right_label_text = str(self.get_x_labels()[-1])
+        right_label_text = str(self._cached('get_x_labels')[-1])
         label_right = len(right_label_text) / 2 * self.font_size * 0.6
         self.border_right = max(label_right, self.border_right)
 
@@ -197,25 +199,28 @@ class Plot(Graph):
         Return all the values for a single axis of the data.
         """
         data_index = getattr(self, f'{axis}_data_index')
-        return [p[data_index] for p in dataset['data']]
+        return list(map(itemgetter(data_index), dataset['data']))
 
-    def data_max(self, axis):
-        max_value = max(
+    def _axis_extrema(self, axis):
+        """
+        Return the (lowest, highest) data values on the axis.
+        """
+        values = list(
             itertools.chain.from_iterable(
-                self.get_single_axis_values(axis, ds) for ds in self.data
+                self.get_single_axis_values(axis, dataset) for dataset in self.data
             )
         )
+        return min(values), max(values)
+
+    def data_max(self, axis):
+        max_value = self._cached('_axis_extrema', axis)[1]
         spec_max = getattr(self, f'max_{axis}_value')
         if spec_max is not None:
             max_value = max(max_value, spec_max)
         return max_value
 
     def data_min(self, axis):
-        min_value = min(
-            itertools.chain.from_iterable(
-                self.get_single_axis_values(axis, ds) for ds in self.data
-            )
-        )
+        min_value = self._cached('_axis_extrema', axis)[0]
         spec_min = getattr(self, f'min_{axis}_value')
         if spec_min is not None:
             min_value = min(min_value, spec_min)
@@ -255,7 +260,7 @@ class Plot(Graph):
 
     def get_data_values(self, axis):
         min_value, max_value, scale_division = self.data_range(axis)
-        return tuple(float_range(*self.data_range(axis)))
+        return float_steps(min_value, max_value, scale_division)
 
     def get_x_values(self):
         return self.get_data_values('x')
@@ -268,15 +273,15 @@ class Plot(Graph):
         return str(round(value, 4))
 
     def get_x_labels(self):
-        return list(map(self._make_label, self.get_x_values()))
+        return list(map(self._make_label, self._cached('get_x_values')))
 
     def get_y_labels(self):
-        return list(map(self._make_label, self.get_y_values()))
+        return list(map(self._make_label, self._cached('get_y_values')))
 
     def field_size(self, axis):
         size = {'x': 'width', 'y': 'height'}[axis]
         side = {'x': 'right', 'y': 'top'}[axis]
-        values = getattr(self, 'get_%s_values' % axis)()
+        values = self._cached(f'get_{axis}_values')
         max_d = self.data_max(axis)
         dx = (
             float(max_d - values[-1]) / (values[-1] - values[-2])
@@ -331,7 +336,8 @@ class Plot(Graph):
 
     def _draw_constant_lines(self):
         if hasattr(self, 'constant_lines'):
-            list(map(self.__draw_constant_line, self.constant_lines))
+            for value_label_style in self.constant_lines:
+                self.__draw_constant_line(value_label_style)
 
     def __draw_constant_line(self, value_label_style):
         "Draw a constant line on the y-axis with the label"
@@ -354,28 +360,23 @@ class Plot(Graph):
 
     def load_transform_parameters(self):
         "Cache the parameters necessary to transform x & y coordinates"
-        x_min, x_max, x_div = self.x_range()
-        y_min, y_max, y_div = self.y_range()
+        x_min, x_max, _ = self.x_range()
+        y_min, y_max, _ = self.y_range()
         x_step = (float(self.graph_width) - self.font_size * 2) / (x_max - x_min)
         y_step = (float(self.graph_height) - self.font_size * 2) / (y_max - y_min)
-        self.__transform_parameters = dict(locals())
-        del self.__transform_parameters['self']
+        self.__transform_parameters = x_min, x_step, y_min, y_step
 
     def get_graph_points(self, data_points):
         return list(map(self.transform_output_coordinates, data_points))
 
     def get_lpath(self, points):
-        points = map(lambda p: "{:f} {:f}".format(*p), points)
-        return 'L' + ' '.join(points)
+        # format all of the coordinates in a single operation
+        template = ' '.join(['%f %f'] * len(points))
+        return 'L' + template % tuple(itertools.chain.from_iterable(points))
 
     def transform_output_coordinates(self, point):
         x, y = point[:2]
-        x_min = self.__transform_parameters['x_min']
-        x_step = self.__transform_parameters['x_step']
-        y_min = self.__transform_parameters['y_min']
-        y_step = self.__transform_parameters['y_step']
-        # locals().update(self.__transform_parameters)
-        # vars().update(self.__transform_parameters)
+        x_min, x_step, y_min, y_step = self.__transform_parameters
         x = (x - x_min) * x_step
         y = self.graph_height - (y - y_min) * y_step
         return x, y
@@ -383,21 +384,27 @@ class Plot(Graph):
     def draw_data_points(self, line, data_points, graph_points):
         if not self.show_data_points and not self.show_data_values:
             return
+        if self.show_data_points:
+            point_class = f'dataPoint{line}'
+            points = (
+                etree.Element(
+                    'circle',
+                    {'cx': str(gx), 'cy': str(gy), 'r': '2.5', 'class': point_class},
+                )
+                for gx, gy in graph_points
+            )
+            self.graph.extend(points)
+        show_data_values = self.show_data_values
+        add_popup = self.add_popup
+        format_point = self.format
+        make_text = self.make_datapoint_text
         for dp, (gx, gy) in zip(data_points, graph_points):
             dx = dp[0]
             dy = dp[1]
-            if self.show_data_points:
-                doc = {
-                    'cx': str(gx),
-                    'cy': str(gy),
-                    'r': '2.5',
-                    'class': 'dataPoint{line}'.format(**locals()),
-                }
-                etree.SubElement(self.graph, 'circle', doc)
-            if self.show_data_values:
-                self.add_popup(gx, gy, self.format(dx, dy))
+            if show_data_values:
+                add_popup(gx, gy, format_point(dx, dy))
             text = getattr(dp, 'text', dy)
-            self.make_datapoint_text(gx, gy - 6, text)
+            make_text(gx, gy - 6, text)
 
     def format(self, x, y):
         return f'({x:0.2f}, {y:0.2f})'
@@ -7,7 +7,7 @@ from more_itertools.recipes import grouper
 from tempora import date_range
 
 from .graph import Graph
-from .util import flatten_mapping, reverse_mapping
+from .util import flatten_mapping
 
 __all__ = ('Schedule',)
 
@@ -18,9 +18,10 @@ class TimeScale:
     def __init__(self, width, range):
         self.width = width
         self.range = range
+        self._per_second = width / range.total_seconds()
 
     def __mul__(self, delta):
-        return delta / self.range * self.width
+        return delta.total_seconds() * self._per_second
 
 
 class Schedule(Graph):
@@ -182,7 +183,13 @@ class Schedule(Graph):
         conf['data'] = reordered_triples
 
     def parse_date(self, date_string):
-        return parse(date_string)
+        # schedules often repeat dates; parse each once per chart
+        cache = self.__dict__.setdefault('_parsed_dates', {})
+        try:
+            return cache[date_string]
+        except KeyError:
+            result = cache[date_string] = parse(date_string)
+            return result
 
     def set_min_x_value(self, value):
         if isinstance(value, str):
@@ -214,9 +221,10 @@ class Schedule(Graph):
         return labels
 
     def draw_data(self):
-        bar_gap = self.get_bar_gap(self.get_field_height())
+        field_height = self.get_field_height()
+        bar_gap = self.get_bar_gap(field_height)
 
-        subbar_height = self.get_field_height() - bar_gap
+        subbar_height = field_height - bar_gap
 
         # y_mod = (subbar_height / 2) + (self.font_size / 2)
         x_min, x_max, div = self._x_range()
@@ -230,23 +238,28 @@ class Schedule(Graph):
         last = -1
         data = self.data[last]['data']
 
-        for index, (x_start, x_end, _label) in enumerate(data):
-            count = index + 1  # index is 0-based, count is 1-based
-            y = self.graph_height - (self.get_field_height() * count)
-            bar_width = scale * (x_end - x_start)
-            bar_start = scale * (x_start - x_min)
+        # compute the geometry of every bar up front
+        bars = [
+            (scale * (x_start - x_min), scale * (x_end - x_start))
+            for x_start, x_end, _label in data
+        ]
+        graph_height = self.graph_height
+        height = str(subbar_height)
 
-            etree.SubElement(
-                self.graph,
+        rects = (
+            etree.Element(
                 'rect',
                 {
                     'x': str(bar_start),
-                    'y': str(y),
+                    'y': str(graph_height - (field_height * count)),
                     'width': str(bar_width),
-                    'height': str(subbar_height),
-                    'class': 'fill%s' % (count + 1),
+                    'height': height,
+                    'class': f'fill{count + 1}',
                 },
             )
+            for count, (bar_start, bar_width) in enumerate(bars, 1)
+        )
+        self.graph.extend(rects)
 
     def _x_range(self):
         # ruby version uses teh last data supplied
@@ -305,19 +318,26 @@ class Schedule(Graph):
         'years'
         >>> lrp('s')
         'seconds'
+        >>> lrp('fortnights')
+        Traceback (most recent call last):
+        ...
+        ValueError: fortnights doesn't match any supported time/date unit
         """
         try:
-            return cls._rdp_map()[unit_string.lower()]
+            return _RDP_MAP[unit_string.lower()]
         except KeyError:
-            raise ValueError("%s doesn't match any supported time/date unit")
-
-    @staticmethod
-    def _rdp_map():
-        years = 'years', 'year', 'yrs', 'yr'
-        months = 'months', 'month', 'mo'
-        weeks = 'weeks', 'week', 'wks', 'wk'
-        days = 'days', 'day'
-        hours = 'hours', 'hour', 'hr', 'hrs', 'h'
-        minutes = 'minutes', 'minute', 'min', 'mins', 'm'
-        seconds = 'seconds', 'second', 'sec', 'secs', 's'
-        return flatten_mapping(reverse_mapping(locals()))
+            raise ValueError(
+                f"{unit_string} doesn't match any supported time/date unit"
+            ) from None
+
+
+_RDP_MAP = flatten_mapping({
+    ('years', 'year', 'yrs', 'yr'): 'years',
+    ('months', 'month', 'mo'): 'months',
+    ('weeks', 'week', 'wks', 'wk'): 'weeks',
+    ('days', 'day'): 'days',
+    ('hours', 'hour', 'hr', 'hrs', 'h'): 'hours',
+    ('minutes', 'minute', 'min', 'mins', 'm'): 'minutes',
+    ('seconds', 'second', 'sec', 'secs', 's'): 'seconds',
+})
+"The relativedelta parameter for each supported unit name"
@@ -1,16 +1,36 @@
 import datetime
 import re
-from time import mktime
 
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 
 import svg.charts.plot
 
-from .util import float_range
+from .util import float_steps
 
 fromtimestamp = datetime.datetime.fromtimestamp
 
+_TIMESCALE_RE = re.compile(
+    r'(?P<amount>\d+) '
+    '?(?P<division_units>days|weeks|months|years|hours|minutes|seconds)?'
+)
+
+
+def _parse_date(date_string, format=None):
+    if format:
+        try:
+            date = datetime.datetime.strptime(date_string, format)
+        except ValueError:
+            pass
+        else:
+            return date.timestamp()
+    try:
+        # ISO 8601 dates are common and much faster to parse natively
+        date = datetime.datetime.fromisoformat(date_string)
+    except ValueError:
+        date = parse(date_string)
+    return date.timestamp()
+
 
 class Plot(svg.charts.plot.Plot):
     """
@@ -89,8 +109,9 @@ class Plot(svg.charts.plot.Plot):
     and that the data in the datasets needn't be in order; they will be ordered
     by the plot along the X-axis.
 
-    The dates must be parseable by ParseDate, but otherwise can be
-    any order of magnitude (seconds within the hour, or years)
+    The dates must be parseable by ParseDate or be numeric timestamps
+    (seconds since the epoch), but otherwise can be any order of
+    magnitude (seconds within the hour, or years)
     """
 
     popup_format = x_label_format = '%Y-%m-%d %H:%M:%S'
@@ -99,6 +120,15 @@ class Plot(svg.charts.plot.Plot):
         "The format string used to format the X axis labels.  See strftime."
     )
 
+    x_parse_format = None
+    """
+    The strptime format of the dates in the data, if known. Dates
+    are parsed much faster with a format; any date not matching it
+    is parsed by dateutil as usual. For example:
+
+    ts.x_parse_format = "%m/%d/%y"
+    """
+
     timescale_divisions = None
     r"""
     Use this to set the spacing between dates on the axis.  The value
@@ -143,8 +173,8 @@ class Plot(svg.charts.plot.Plot):
         super().process_data(data)
         # the date should be in the first axis;
         # replace value with parsed date.
-        series = data['data']
-        data['data'] = [(self.parse_date(p[0]),) + tuple(p[1:]) for p in series]
+        parse_date = self.parse_date
+        data['data'] = [(parse_date(x), *rest) for x, *rest in data['data']]
 
     _min_x_value = svg.charts.plot.Plot.min_x_value
 
@@ -158,46 +188,64 @@ class Plot(svg.charts.plot.Plot):
     min_x_value = property(get_min_x_value, set_min_x_value)  # type: ignore
 
     def format(self, x, y):
-        return fromtimestamp(x).strftime(self.popup_format)
+        return self._cached('_format_time', x, self.popup_format)
 
     def get_x_labels(self):
-        return list(
-            map(
-                lambda t: fromtimestamp(t).strftime(self.x_label_format),
-                self.get_x_values(),
-            )
-        )
+        format = self.x_label_format
+        cached = self._cached
+        return [cached('_format_time', t, format) for t in cached('get_x_values')]
+
+    @staticmethod
+    def _format_time(timestamp, format):
+        # labels and popups often repeat times; they are cached per burn
+        return fromtimestamp(timestamp).strftime(format)
 
     def get_x_values(self):
         result = self.get_x_timescale_division_values()
         if result:
             return result
-        return tuple(float_range(*self.x_range()))
+        return float_steps(*self.x_range())
+
+    _timescale_cache = None, None
 
     def get_x_timescale_division_values(self):
         if not self.timescale_divisions:
             return
         min, max, scale_division = self.x_range()
-        m = re.match(
-            r'(?P<amount>\d+) '
-            '?(?P<division_units>days|weeks|months|years|hours|minutes|seconds)?',
-            self.timescale_divisions,
-        )
+        # reuse the values from the last burn if the axis is unchanged
+        key = self.timescale_divisions, min, max
+        cached_key, result = self._timescale_cache
+        if cached_key != key:
+            result = self._divide_timescale(min, max)
+            self._timescale_cache = key, result
+        return result
+
+    def _divide_timescale(self, min, max):
+        m = _TIMESCALE_RE.match(self.timescale_divisions)
         # copy amount and division_units into the local namespace
-        division_units = m.groupdict()['division_units'] or 'days'
-        amount = int(m.groupdict()['amount'])
+        division_units = m['division_units'] or 'days'
+        amount = int(m['amount'])
         if not amount:
             return
         delta = relativedelta(**{division_units: amount})
-        result = tuple(self.get_time_range(min, max, delta))
-        return result
+        return tuple(self.get_time_range(min, max, delta))
 
     def get_time_range(self, start, stop, delta):
         start, stop = map(fromtimestamp, (start, stop))
         current = start
         while current <= stop:
-            yield mktime(current.timetuple())
+            yield current.timestamp()
             current += delta
 
     def parse_date(self, date_string):
-        return mktime(parse(date_string).timetuple())
+        if isinstance(date_string, (int, float)):
+            # already seconds since the epoch
+            return float(date_string)
+        # series often repeat dates; cache the timestamp for each string
+        cache = self.__dict__.setdefault('_parsed_dates', {})
+        key = date_string, self.x_parse_format
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = _parse_date(*key)
+            return result
@@ -1,3 +1,5 @@
+import math
+
 from more_itertools import always_iterable
 
 
@@ -33,7 +35,43 @@ def float_range(start=0, stop=None, step=1):
     >>> tuple(float_range(0, 9, 1.5))
     (0.0, 1.5, 3.0, 4.5, 6.0, 7.5)
     """
+    yield from float_steps(start, stop, step)
+
+
+def float_steps(start, stop, step):
+    """
+    Like float_range, but return all of the values at once, each
+    computed directly from its index rather than by accumulation.
+
+    >>> float_steps(0, 9, 1.5)
+    (0.0, 1.5, 3.0, 4.5, 6.0, 7.5)
+    >>> float_steps(0, 0.3, 0.1)
+    (0.0, 0.1, 0.2)
+    >>> float_steps(5, 5, 1)
+    ()
+    """
     start = float(start)
-    while start < stop:
-        yield start
-        start += step
+    count = max(0, math.ceil((stop - start) / step))
+    if count and start + step * (count - 1) >= stop:
+        count -= 1
+    return tuple(start + step * index for index in range(count))
+
+
+def format_number(value, precision=2):
+    """
+    Render a coordinate for an SVG attribute, rounded to ``precision``
+    decimal places and without insignificant trailing zeros.
+
+    >>> format_number(3.14159)
+    '3.14'
+    >>> format_number(250.0)
+    '250'
+    >>> format_number(12)
+    '12'
+    >>> format_number(-0.001)
+    '0'
+    """
+    if isinstance(value, int):
+        return str(value)
+    result = f'{value:.{precision}f}'.rstrip('0').rstrip('.')
+    return '0' if result == '-0' else result
@@ -0,0 +1,74 @@
+from lxml import etree
+
+from svg.charts import bar
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+def make_chart(cls=bar.VerticalBar, **options):
+    g = cls(['a', 'b', 'c'], options)
+    g.add_data({'data': [1, 3, 2], 'title': 'first'})
+    g.add_data({'data': [2, 0, 4], 'title': 'second'})
+    return g
+
+
+def test_bars_grouped():
+    """
+    Bars are emitted as children of a single group.
+    """
+    for cls in bar.VerticalBar, bar.HorizontalBar:
+        root = etree.fromstring(make_chart(cls).burn())
+        (group,) = root.findall(f'.//{SVG}g[@class="bars"]')
+        assert len(group.findall(SVG + 'rect')) == 5
+
+
+def test_zero_length_bars_skipped():
+    """
+    A bar with no length draws nothing, so no rect is emitted for it,
+    but its value is still labeled.
+    """
+    g = bar.VerticalBar(['a', 'b'])
+    g.add_data({'data': [0, 3], 'title': 'series'})
+    root = etree.fromstring(g.burn())
+    heights = [rect.get('height') for rect in root.iter(SVG + 'rect')]
+    assert '0' not in heights
+    labels = [
+        text.text
+        for text in root.iter(SVG + 'text')
+        if text.get('class') == 'dataPointLabel'
+    ]
+    assert '0' in labels
+
+
+def test_data_labels_rounded():
+    """
+    Labels should be rounded to 4 digits of precision.
+    """
+    g = bar.VerticalBar(['a', 'b'], dict(scale_divisions=0.1))
+    g.add_data({'data': [0.25, 0.7], 'title': 'fractions'})
+    labels = g.get_data_labels()
+    assert '0.3' in labels
+    assert all(len(label) <= 6 for label in labels)
+
+
+def test_reuse_bar_shapes():
+    g = bar.VerticalBar(['a', 'b', 'c'], dict(reuse_bar_shapes=True))
+    g.add_data({'data': [2, 2, 1], 'title': 'series'})
+    root = etree.fromstring(g.burn())
+    (shape,) = root.findall(f'{SVG}defs/{SVG}rect')
+    uses = root.findall(f'.//{SVG}g[@class="bars"]/{SVG}use')
+    assert len(uses) == 2
+    href = '{http://www.w3.org/1999/xlink}href'
+    assert {use.get(href) for use in uses} == {'#' + shape.get('id')}
+
+
+def test_data_value_halo():
+    """
+    Each data value is outlined by a halo unless disabled.
+    """
+    for halo, count in (True, 12), (False, 6):
+        root = etree.fromstring(make_chart(show_data_value_halo=halo).burn())
+        labels = root.findall(f'.//{SVG}text[@class="dataPointLabel"]')
+        assert len(labels) == count
+        styles = {label.get('style') for label in labels[:2]}
+        assert 'None' not in ''.join(filter(None, styles))
@@ -0,0 +1,80 @@
+from lxml import etree
+
+from svg.charts.line import Line
+
+
+def test_min_scale_value_zero():
+    """
+    A min_scale_value of zero is honored rather than treated as unset.
+    """
+    g = Line(dict(fields=['a', 'b', 'c'], min_scale_value=0))
+    g.add_data({'data': [5, 8, 6], 'title': 'series'})
+    assert g.min_value() == 0
+
+
+def test_stacked_extrema():
+    """
+    Stacked lines are scaled to the cumulative values.
+    """
+    g = Line(dict(fields=['a', 'b', 'c'], stacked=True))
+    g.add_data({'data': [5, 8, 6], 'title': 'first'})
+    g.add_data({'data': [1, -9, 2], 'title': 'second'})
+    assert list(map(list, g.get_cumulative_data())) == [[5, 8, 6], [6, -1, 8]]
+    assert g.max_value() == 8
+    assert g.min_value() == -1
+
+
+def test_data_points_drawn():
+    """
+    Each value is marked with a point and labeled.
+    """
+    g = Line(dict(fields=['a', 'b', 'c']))
+    g.add_data({'data': [5, 8, 6], 'title': 'series'})
+    svg = g.burn()
+    assert svg.count('<circle') == 3
+    assert '>8</text>' in svg
+
+
+def test_stacked_area_fill():
+    """
+    Each stacked area is filled down to the series beneath it.
+    """
+    options = dict(stacked=True, area_fill=True, min_scale_value=0)
+    g = Line(dict(fields=['a', 'b', 'c'], **options))
+    g.add_data({'data': [5, 8, 6], 'title': 'first'})
+    g.add_data({'data': [1, 2, 2], 'title': 'second'})
+    root = etree.fromstring(g.burn())
+    paths = {
+        path.get('class'): path.get('d')
+        for path in root.iter('{http://www.w3.org/2000/svg}path')
+    }
+
+    def tops(line):
+        "The (x, y) text of each point along the top of the line"
+        coords = paths[line].partition('L')[2].split()
+        return [' '.join(pair) for pair in zip(coords[::2], coords[1::2])]
+
+    first, second = tops('line1'), tops('line2')
+    assert first[0] != f'0.0 {float(g.graph_height)}'
+    # trace the second series left to right, then the first back
+    expected = ['M', first[0], 'L', *second, *reversed(first), 'Z']
+    assert paths['fill2'] == ' '.join(expected)
+
+
+def test_calc_coords_override():
+    """
+    Points are placed by calc_coords, so subclasses may override it.
+    """
+
+    class ShiftedLine(Line):
+        def calc_coords(self, field, value, width=None, height=None):
+            coords = super().calc_coords(field, value, width, height)
+            coords['y'] += 1000
+            return coords
+
+    g = ShiftedLine(dict(fields=['a', 'b', 'c']))
+    g.add_data({'data': [5, 8, 6], 'title': 'series'})
+    root = etree.fromstring(g.burn())
+    circles = list(root.iter('{http://www.w3.org/2000/svg}circle'))
+    assert circles
+    assert all(float(c.get('cy')) > 1000 for c in circles)
@@ -1,7 +1,9 @@
 import csv
 import pathlib
 
+import cssutils
 import pytest
+from lxml import etree
 from more_itertools.recipes import flatten
 
 from svg.charts.plot import Plot
@@ -117,3 +119,125 @@ class TestPlot:
         res = g.burn()
         assert '0.30' not in res
         assert '0.3' in res
+
+    def test_popup_ids(self):
+        """
+        Each popup is identified by a name derived from its label.
+        """
+        g = Plot(dict(show_data_values=True))
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        svg = g.burn()
+        assert 'label-None' not in svg
+        assert 'id="label-(1.00,_0.00)"' in svg
+
+    def test_inline_styles_leave_stylesheet_unchanged(self):
+        """
+        Rendering with inline styles should not affect the stylesheet
+        embedded in subsequent charts.
+        """
+        g = Plot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        before = g.burn()
+        inline = Plot(dict(css_inline=True))
+        inline.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        inline.burn()
+        assert g.burn() == before
+
+    def test_burn_to(self, tmp_path):
+        g = Plot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        target = tmp_path / 'plot.svg'
+        g.burn_to(target)
+        content = target.read_text(encoding='utf-8')
+        assert content.startswith('<?xml')
+        assert content.endswith(g.burn())
+
+    def test_points_ordered_by_x(self):
+        g = Plot()
+        g.add_data(dict(data=[3, 1, 1, 5, 1, 2], title='foo'))
+        assert g.data[0]['data'] == [[1, 5], [1, 2], [3, 1]]
+
+    def test_labels_computed_once_per_burn(self):
+        """
+        Values used throughout a burn are computed once per burn.
+        """
+        calls = []
+
+        class CountingPlot(Plot):
+            def get_x_labels(self):
+                calls.append(self)
+                return super().get_x_labels()
+
+        g = CountingPlot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        g.burn()
+        assert len(calls) == 1
+        g.burn()
+        assert len(calls) == 2
+
+    def test_label_hooks_take_one_label(self):
+        drawn = []
+
+        class LabelPlot(Plot):
+            def draw_x_label(self, label):
+                drawn.append(label)
+                super().draw_x_label(label)
+
+            def draw_y_label(self, label):
+                drawn.append(label)
+                super().draw_y_label(label)
+
+        g = LabelPlot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        g.burn()
+        assert drawn
+
+    def test_stylesheet_resources_override(self):
+        class StyledPlot(Plot):
+            def get_stylesheet_resources(self):
+                extra = cssutils.parseString('.extra { fill: red }')
+                return super().get_stylesheet_resources() + [extra]
+
+        g = StyledPlot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        assert '.extra' in g.burn()
+
+    def test_load_resource_stylesheet_override(self):
+        class StyledPlot(Plot):
+            @staticmethod
+            def load_resource_stylesheet(name, subs=None):
+                sheet = Plot.load_resource_stylesheet(name, subs)
+                sheet.add('.custom { fill: red }')
+                return sheet
+
+        g = StyledPlot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        assert '.custom' in g.burn()
+
+    def test_parsed_css_not_shared(self):
+        g = Plot()
+        g.parse_css()['.line1'] = 'stroke: red;'
+        inline = Plot(dict(css_inline=True))
+        inline.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        assert 'stroke: red;' not in inline.burn()
+
+    def test_stylesheet_not_shared(self):
+        g = Plot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        before = g.burn()
+        g.get_stylesheet().add('.extra { fill: red }')
+        assert b'.extra' not in Plot().get_stylesheet().cssText
+        assert g.burn() == before
+
+    def test_transform_override_moves_points(self):
+        class ShiftedPlot(Plot):
+            def transform_output_coordinates(self, point):
+                x, y = super().transform_output_coordinates(point)
+                return x, y + 1000
+
+        g = ShiftedPlot()
+        g.add_data(dict(data=[1, 0, 2, 1], title='foo'))
+        root = etree.fromstring(g.burn())
+        circles = list(root.iter('{http://www.w3.org/2000/svg}circle'))
+        assert circles
+        assert all(float(c.get('cy')) > 1000 for c in circles)
@@ -1,3 +1,8 @@
+import datetime
+import time
+
+import pytest
+
 from svg.charts import time_series
 
 
@@ -19,3 +24,112 @@ def test_field_width():
     })
     g.burn()
     assert g.field_width() > 1
+
+
+def test_parse_format():
+    """
+    Dates matching x_parse_format and dates needing dateutil
+    parse to the same times.
+    """
+    g = time_series.Plot({})
+    expected = g.parse_date('2005-12-21T06:30:00')
+    g.x_parse_format = '%d/%m/%Y %H:%M'
+    assert g.parse_date('21/12/2005 06:30') == expected
+    assert g.parse_date('2005-12-21T06:30:00') == expected
+
+
+def test_parse_date_offset():
+    """
+    Dates with a UTC offset are placed at that offset rather than
+    read as local time.
+    """
+    g = time_series.Plot({})
+    utc = g.parse_date('2005-12-21T06:30:00+00:00')
+    assert g.parse_date('2005-12-21T07:30:00+01:00') == utc
+    assert g.parse_date('21 Dec 2005 06:30 UTC') == utc
+
+
+def test_fixed_timescale_divisions():
+    g = time_series.Plot({})
+    g.timescale_divisions = '4 hours'
+    g.add_data({
+        'data': [('2005-12-21T00:00:00', 20), ('2005-12-22T00:00:00', 21)],
+        'title': 'series 1',
+    })
+    values = g.get_x_values()
+    assert len(values) == 7
+    assert {b - a for a, b in zip(values, values[1:])} == {4 * 60 * 60}
+
+
+@pytest.fixture
+def set_timezone(monkeypatch):
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time.tzset is required")
+
+    def set_timezone(name):
+        monkeypatch.setenv('TZ', name)
+        time.tzset()
+
+    yield set_timezone
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def eastern_time(set_timezone):
+    set_timezone('America/New_York')
+
+
+def test_timescale_divisions_across_dst(eastern_time):
+    """
+    Divisions keep to the wall clock across a daylight saving change.
+    """
+    g = time_series.Plot({})
+    g.timescale_divisions = '4 hours'
+    g.add_data({
+        'data': [('2005-04-03T00:00:00', 20), ('2005-04-03T12:00:00', 21)],
+        'title': 'series 1',
+    })
+    values = g.get_x_values()
+    hours = [datetime.datetime.fromtimestamp(value).hour for value in values]
+    assert hours == [0, 4, 8, 12]
+
+
+def test_numeric_dates():
+    g = time_series.Plot({})
+    stamp = g.parse_date('2005-12-21T06:30:00')
+    g.add_data({'data': [int(stamp), 20, stamp + 60, 21], 'title': 'series 1'})
+    assert [x for x, y in g.data[0]['data']] == [stamp, stamp + 60]
+
+
+def test_timescale_divisions_reused():
+    g = time_series.Plot({})
+    g.timescale_divisions = '1 months'
+    g.add_data({
+        'data': [('2005-01-01T00:00:00', 20), ('2005-12-01T00:00:00', 21)],
+        'title': 'series 1',
+    })
+    values = g.get_x_timescale_division_values()
+    assert len(values) == 12
+    assert g.get_x_timescale_division_values() is values
+    g.timescale_divisions = '2 months'
+    assert len(g.get_x_timescale_division_values()) == 6
+
+
+def test_parse_date_in_current_timezone(set_timezone):
+    """
+    Dates parsed by one chart don't carry its timezone into another.
+    """
+    set_timezone('UTC')
+    time_series.Plot({}).parse_date('2005-12-21T06:30:00')
+    set_timezone('America/New_York')
+    expected = datetime.datetime(2005, 12, 21, 6, 30).timestamp()
+    assert time_series.Plot({}).parse_date('2005-12-21T06:30:00') == expected
+
+
+def test_format_in_current_timezone(set_timezone):
+    g = time_series.Plot({})
+    set_timezone('UTC')
+    g.format(1135146600.0, 0)
+    set_timezone('America/New_York')
+    assert g.format(1135146600.0, 0) == '2005-12-21 01:30:00'